@@ -5,6 +5,7 @@
 #     "pyserial",
 #     "websockets",
 #     "influxdb-client",
+#     "uvloop; sys_platform != 'win32'",
 # ]
 # ///
 """
@@ -22,23 +23,39 @@ The web app connects to ws://localhost:8766 (default).
 """
 
 import asyncio
-import datetime
+import contextlib
 import getpass
 import os
+import re
 import shutil
 import signal
+import struct
 import sys
+import threading
 import time
+from array import array
+from typing import NamedTuple
 
 import serial
 import serial.tools.list_ports
 import websockets
 
+try:
+    import uvloop  # libuv-based event loop; not available on Windows
+except ImportError:
+    uvloop = None
+
 
 BAUD_RATE = 9600
 WS_HOST = "localhost"
 WS_PORT = 8766
 FRAME_LENGTH = 9
+FRAME_MARKER = b"\x07\x05"  # frame start: length=7, page=5
+FRAME_INTERVAL_MS = 20     # gauge frame spacing (50 Hz)
+WS_COALESCE_S = 0.005      # gather serial chunks this long before a ws.send
+WS_COALESCE_BYTES = 4096   # ...or until this many bytes are pending
+WS_QUEUE_MAX = 64          # serial chunks queued per client before dropping oldest
+PARSE_BUF_MAX = 64 * 1024  # cap on the side parse buffer (oldest bytes dropped)
 TUI_ROWS = 10   # fixed terminal rows used by TUI (passive: no command input)
 TUI_UPDATE_HZ = 5  # max TUI refresh rate (gauge streams at 50 Hz)
 
@@ -56,22 +73,36 @@ INFLUXDB_MEASUREMENT = None   # e.g. "itr90_chamber1"
 # ─────────────────────────────────────────────────────────────────────────────
 
 # InfluxDB state (set by setup_influxdb)
-_influx = None  # dict with write_api, bucket, org, measurement, client
-_last_influx_write = 0.0  # monotonic timestamp for throttling
+_influx = None  # InfluxCtx (client, write_api, bucket, org, ...) when enabled
+WritePrecision = None  # influxdb_client.WritePrecision, bound by setup_influxdb
+
+# Reading hand-off from the serial path to the TUI / InfluxDB consumers
+_pressure_queue   = asyncio.Queue(maxsize=256)  # (pressure_mbar, time_ms)
+_latest_pressure  = None    # newest reading, picked up by tui_consumer
+_reading_count    = 0       # readings published so far (TUI change detection)
+_dropped_readings = 0       # readings dropped because _pressure_queue was full
+_last_stamp_ms    = 0       # newest InfluxDB timestamp handed out (kept increasing)
+_dropped_bytes    = 0       # raw bytes dropped from full client queues
+_parse_dropped    = 0       # raw bytes trimmed from the parse buffer
+_subscribers      = set()   # per-client asyncio.Queue of raw serial chunks (None = stop)
 
 # ─────────────────────────────────────────────────────────────────────────────
 # TUI STATE
 # ─────────────────────────────────────────────────────────────────────────────
 _tui_active         = False
 _tui_pressure       = None          # latest pressure in mbar (float or None)
-_tui_client         = None          # connected client IP string or None
+_tui_clients        = []            # IP strings of connected clients
 _tui_influx_desc    = "disabled"    # "disabled" or "enabled (name)"
 _tui_transport_desc = ""
 _tui_last_update    = ""
 _tui_term_state     = None          # saved termios state for restore
 _tui_loop           = None          # event loop reference set in tui_start()
-_tui_last_draw      = 0.0           # monotonic time of last TUI redraw (throttle)
 _tui_w              = 80            # current terminal width
+_tui_cache          = {}            # width-dependent frame bytes (see _tui_static_parts)
+
+# Fixed TUI output, encoded once: cursor moves to row N (index N) and border
+_TUI_ROW_POS = [f"\033[{row};1H".encode() for row in range(TUI_ROWS + 1)]
+_TUI_VBAR    = "\u2502".encode()
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -91,11 +122,43 @@ def _tui_can_use():
         return False
 
 
+def _tui_write(payload):
+    """Write all of payload to the stdout fd, retrying partial writes."""
+    view = memoryview(payload)
+    while view:
+        view = view[os.write(sys.stdout.fileno(), view):]
+
+
 def _tui_box_line(content, row):
-    """Write a │-bordered content line at the given 1-indexed row."""
+    """Return a │-bordered content line at the given 1-indexed row (bytes)."""
     inner = _tui_w - 2
     padded = content[:inner].ljust(inner)
-    sys.stdout.write(f"\033[{row};1H\u2502{padded}\u2502")
+    return b"".join((_TUI_ROW_POS[row], _TUI_VBAR, padded.encode(), _TUI_VBAR))
+
+
+def _tui_status_line():
+    """Format row 7: InfluxDB state on the left, client state on the right."""
+    inner = _tui_w - 2
+    influx_str = f"InfluxDB: {_tui_influx_desc}"
+    if len(_tui_clients) > 1:
+        client_str = f"Clients: {len(_tui_clients)} connected"
+    elif _tui_clients:
+        client_str = "Client: connected (" + _tui_clients[0] + ")"
+    else:
+        client_str = "Client: disconnected"
+    gap = max(2, inner - 4 - len(influx_str) - len(client_str))
+    return f"  {influx_str}{' ' * gap}{client_str}"
+
+
+def _tui_update_line():
+    """Format row 9: last update time, plus dropped data if any."""
+    s = f"  Updated: {_tui_last_update or '--:--:--'}"
+    if _dropped_readings or _dropped_bytes or _parse_dropped:
+        s += (f"    Dropped: {_dropped_readings} readings,"
+              f" {_dropped_bytes} client bytes")
+        if _parse_dropped:
+            s += f", {_parse_dropped} parse bytes"
+    return s
 
 
 def _tui_pressure_line():
@@ -138,10 +201,9 @@ def tui_start(transport_desc, influx_desc):
     sys.stdout.flush()
     tui_draw()
 
-    _tui_loop = asyncio.get_event_loop()
+    _tui_loop = asyncio.get_running_loop()
     try:
-        _tui_loop.add_signal_handler(signal.SIGWINCH,
-                                     lambda: (tui_draw(), sys.stdout.flush()))
+        _tui_loop.add_signal_handler(signal.SIGWINCH, tui_resize)
     except (OSError, NotImplementedError):
         pass
 
@@ -175,91 +237,102 @@ def tui_stop():
 # TUI DRAWING
 # ─────────────────────────────────────────────────────────────────────────────
 
-def tui_draw():
-    """Full TUI redraw — used on startup and terminal resize."""
+def _tui_static_parts():
+    """Return the width-dependent border and label bytes for tui_draw.
+
+    Only the terminal width changes them, so they are rebuilt on resize and
+    otherwise reused from _tui_cache.
+    """
+    if _tui_cache.get("w") != _tui_w:
+        w = _tui_w
+        inner = w - 2
+        title = f" ITR 90 Bridge  ws://{WS_HOST}:{WS_PORT}  [{_tui_transport_desc}] "
+        fill = max(0, w - 2 - len(title) - 1)
+        top = ("\u250c\u2500" + title + "\u2500" * fill + "\u2510")[:w]
+        bot = ("\u2514" + "\u2500" * (w - 2) + "\u2518")[:w]
+        label = "Pressure (mbar)".center(inner)[:inner]
+        _tui_cache.clear()
+        _tui_cache.update(
+            w=w,
+            top=top.encode(),
+            bot=bot.encode(),
+            blank=_TUI_VBAR + (" " * inner).encode() + _TUI_VBAR,
+            label=_TUI_VBAR + label.encode() + _TUI_VBAR,
+        )
+    return _tui_cache
+
+
+def tui_resize():
+    """SIGWINCH handler: re-read the terminal width and redraw."""
     global _tui_w
 
+    cols, _ = shutil.get_terminal_size()
+    _tui_w = min(cols, 120)
+    tui_draw()
+
+
+def tui_draw():
+    """Full TUI redraw — used on startup and terminal resize."""
     if not _tui_active:
         return
 
-    cols, _ = shutil.get_terminal_size()
-    _tui_w = min(cols, 120)
-    w = _tui_w
-    inner = w - 2
+    parts = _tui_static_parts()
+    pos = _TUI_ROW_POS
 
     # Row 1: top border with title
-    title = f" ITR 90 Bridge  ws://{WS_HOST}:{WS_PORT}  [{_tui_transport_desc}] "
-    fill = max(0, w - 2 - len(title) - 1)
-    top = ("\u250c\u2500" + title + "\u2500" * fill + "\u2510")[:w]
-    sys.stdout.write(f"\033[1;1H{top}")
+    out = bytearray(pos[1] + parts["top"])
 
     # Row 2: blank
-    _tui_box_line("", 2)
+    out += pos[2] + parts["blank"]
 
     # Row 3: label
-    _tui_box_line("Pressure (mbar)".center(inner), 3)
+    out += pos[3] + parts["label"]
 
     # Row 4: blank
-    _tui_box_line("", 4)
+    out += pos[4] + parts["blank"]
 
     # Row 5: pressure value
-    _tui_box_line(_tui_pressure_line(), 5)
+    out += _tui_box_line(_tui_pressure_line(), 5)
 
     # Row 6: blank
-    _tui_box_line("", 6)
+    out += pos[6] + parts["blank"]
 
     # Row 7: InfluxDB + client status
-    influx_str = f"InfluxDB: {_tui_influx_desc}"
-    client_str = ("Client: connected (" + _tui_client + ")"
-                  if _tui_client else "Client: disconnected")
-    gap = max(2, inner - 4 - len(influx_str) - len(client_str))
-    _tui_box_line(f"  {influx_str}{' ' * gap}{client_str}", 7)
+    out += _tui_box_line(_tui_status_line(), 7)
 
     # Row 8: blank
-    _tui_box_line("", 8)
+    out += pos[8] + parts["blank"]
 
     # Row 9: last update time
-    _tui_box_line(f"  Updated: {_tui_last_update or '--:--:--'}", 9)
+    out += _tui_box_line(_tui_update_line(), 9)
 
     # Row 10: bottom border
-    bot = ("\u2514" + "\u2500" * (w - 2) + "\u2518")[:w]
-    sys.stdout.write(f"\033[10;1H{bot}")
+    out += pos[10] + parts["bot"]
 
-    sys.stdout.flush()
+    _tui_write(out)
 
 
 def tui_update_reading(pressure_mbar):
-    """Rewrite rows 5 and 9 with the latest pressure reading (throttled)."""
-    global _tui_pressure, _tui_last_update, _tui_last_draw
+    """Rewrite rows 5 and 9 with the latest pressure reading."""
+    global _tui_pressure, _tui_last_update
 
     _tui_pressure = pressure_mbar
     if not _tui_active:
         return
 
-    now = time.monotonic()
-    if now - _tui_last_draw < 1.0 / TUI_UPDATE_HZ:
-        return
-    _tui_last_draw = now
-
-    _tui_last_update = datetime.datetime.now().strftime("%H:%M:%S")
-    inner = _tui_w - 2
-
-    sys.stdout.write(f"\033[5;1H\u2502{_tui_pressure_line()[:inner].ljust(inner)}\u2502")
-
-    content9 = f"  Updated: {_tui_last_update}"
-    sys.stdout.write(f"\033[9;1H\u2502{content9[:inner].ljust(inner)}\u2502")
-
-    sys.stdout.flush()
+    t = time.localtime()
+    _tui_last_update = f"{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}"
+    _tui_write(_tui_box_line(_tui_pressure_line(), 5)
+               + _tui_box_line(_tui_update_line(), 9))
 
 
 def tui_update_client(peer, connected):
     """Update the client connection status display."""
-    global _tui_client
-
+    ip = peer[0] if isinstance(peer, tuple) else str(peer)
     if connected:
-        _tui_client = peer[0] if isinstance(peer, tuple) else str(peer)
-    else:
-        _tui_client = None
+        _tui_clients.append(ip)
+    elif ip in _tui_clients:
+        _tui_clients.remove(ip)
 
     if not _tui_active:
         if connected:
@@ -268,20 +341,17 @@ def tui_update_client(peer, connected):
             print(f"  Client disconnected: {peer}")
         return
 
-    inner = _tui_w - 2
-    influx_str = f"InfluxDB: {_tui_influx_desc}"
-    client_str = ("Client: connected (" + _tui_client + ")"
-                  if _tui_client else "Client: disconnected")
-    gap = max(2, inner - 4 - len(influx_str) - len(client_str))
-    status = f"  {influx_str}{' ' * gap}{client_str}"
-    sys.stdout.write(f"\033[7;1H\u2502{status[:inner].ljust(inner)}\u2502")
-    sys.stdout.flush()
+    _tui_write(_tui_box_line(_tui_status_line(), 7))
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # DEVICE DETECTION
 # ─────────────────────────────────────────────────────────────────────────────
 
+# Device names of USB serial adapters (Linux ttyUSB/ttyACM, macOS cu.usb*/cu.wch*)
+_USB_PORT_RE = re.compile(r"tty(usb|acm)|cu\.(usb|wch)", re.IGNORECASE)
+
+
 def _is_usb_port(p):
     """Return True if this port looks like a USB serial device.
 
@@ -292,8 +362,7 @@ def _is_usb_port(p):
     """
     if p.vid is not None:
         return True
-    name = p.device.lower()
-    return any(s in name for s in ("ttyusb", "ttyacm", "cu.usb", "cu.wch"))
+    return _USB_PORT_RE.search(p.device) is not None
 
 
 def find_serial_port():
@@ -354,9 +423,19 @@ def open_serial(port_name):
 # INFLUXDB
 # ─────────────────────────────────────────────────────────────────────────────
 
+class InfluxCtx(NamedTuple):
+    """Live InfluxDB logging state, built once by setup_influxdb."""
+    client: object
+    write_api: object
+    bucket: str
+    org: str
+    measurement: str
+    lp_prefix: bytes  # b"<measurement> pressure_mbar=", escaped
+
+
 def setup_influxdb():
-    """Interactively configure InfluxDB logging. Returns config dict or None."""
-    global _influx
+    """Interactively configure InfluxDB logging. Returns InfluxCtx or None."""
+    global _influx, WritePrecision
 
     # Use pre-configured values if all USER CONFIGURATION fields are set
     if all([INFLUXDB_URL, INFLUXDB_ORG, INFLUXDB_BUCKET, INFLUXDB_TOKEN, INFLUXDB_MEASUREMENT]):
@@ -388,10 +467,10 @@ def setup_influxdb():
             print("Missing required fields — InfluxDB logging disabled.")
             return None
 
-    from influxdb_client import InfluxDBClient
+    from influxdb_client import InfluxDBClient, WriteOptions, WritePrecision
 
     print("\nTesting connection... ", end="", flush=True)
-    client = InfluxDBClient(url=url, token=token, org=org)
+    client = InfluxDBClient(url=url, token=token, org=org, enable_gzip=True)
     try:
         health = client.health()
         if health.status != "pass":
@@ -404,15 +483,24 @@ def setup_influxdb():
         return None
     print("✓")
 
-    from influxdb_client.client.write_api import SYNCHRONOUS
-    write_api = client.write_api(write_options=SYNCHRONOUS)
-    _influx = {
-        "client": client,
-        "write_api": write_api,
-        "bucket": bucket,
-        "org": org,
-        "measurement": measurement,
-    }
+    # Batching write API: records are queued and flushed from a background
+    # thread every 1 s, so writes never block the event loop; failed batches
+    # are retried after 5 s. batch_size counts write() records, and each
+    # record is a whole burst of readings, so the 1 s interval is what
+    # triggers flushes in practice.
+    write_api = client.write_api(write_options=WriteOptions(
+        batch_size=5000, flush_interval=1000, jitter_interval=200,
+        retry_interval=5000))
+    _influx = InfluxCtx(
+        client=client,
+        write_api=write_api,
+        bucket=bucket,
+        org=org,
+        measurement=measurement,
+        # Line-protocol prefix; measurement names escape commas and spaces
+        lp_prefix=(measurement.replace(",", "\\,").replace(" ", "\\ ")
+                   + " pressure_mbar=").encode(),
+    )
     print(f"InfluxDB logging enabled → {org}/{bucket}/{measurement}\n")
     return _influx
 
@@ -423,8 +511,8 @@ def close_influxdb():
     if _influx:
         print("Flushing InfluxDB...", end=" ", flush=True)
         try:
-            _influx["write_api"].close()
-            _influx["client"].close()
+            _influx.write_api.close()
+            _influx.client.close()
         except Exception:
             pass
         print("done.")
@@ -435,73 +523,77 @@ def close_influxdb():
 # PROTOCOL
 # ─────────────────────────────────────────────────────────────────────────────
 
+# Pressure in mbar for every 16-bit measurement value (high*256 + low).
+# 64K doubles (512 KiB), built once in ~10 ms instead of a pow per frame.
+_PRESSURE_LUT = array("d", (10 ** (raw / 4000 - 12.5) for raw in range(65536)))
+
+# One 9-byte output frame, unpacked as unsigned bytes
+_FRAME_STRUCT = struct.Struct("9B")
+
+
 def parse_itr90_frames(buf):
     """Parse ITR 90 binary frames from buffer.
 
     Scans for frame marker (byte 0 = 7, byte 1 = 5), validates checksum,
-    calculates pressure in mbar.
+    calculates pressure in mbar. The buffer is only read, never copied.
 
-    Returns (readings, remaining_buffer) where readings is a list of
-    pressure_mbar floats.
+    Returns (readings, consumed) where readings is a list of pressure_mbar
+    floats and consumed is the number of leading bytes the caller can drop.
     """
     readings = []
-    while True:
-        # Find frame marker: length=7, page=5
-        idx = -1
-        for i in range(len(buf) - 1):
-            if buf[i] == 7 and buf[i + 1] == 5:
-                idx = i
+    pos = 0
+    with memoryview(buf) as mv:
+        while True:
+            # Find frame marker: length=7, page=5
+            idx = buf.find(FRAME_MARKER, pos)
+            if idx < 0:
+                # Keep a trailing 0x07 in case the marker straddles two reads
+                pos = max(pos, len(buf) - 1)
                 break
-        if idx < 0:
-            if len(buf) > 1:
-                buf = buf[-1:]
-            break
 
-        buf = buf[idx:]
+            pos = idx
 
-        if len(buf) < FRAME_LENGTH:
-            break
+            # Once in sync, frames follow back to back: decode the whole run
+            # of complete frames in one struct.iter_unpack pass and only fall
+            # back to find() when a frame does not start with the marker.
+            count = (len(buf) - pos) // FRAME_LENGTH
+            if count == 0:
+                break
 
-        frame = buf[:FRAME_LENGTH]
-        buf = buf[FRAME_LENGTH:]
+            with mv[pos:pos + count * FRAME_LENGTH] as run:
+                for (length, page, status, error, high, low,
+                     version, sensor, checksum) in _FRAME_STRUCT.iter_unpack(run):
+                    if length != 7 or page != 5:
+                        break
+                    pos += FRAME_LENGTH
 
-        # Validate checksum: low byte of sum(bytes 1-7) must equal byte 8
-        checksum = sum(frame[1:8]) & 0xFF
-        if checksum != frame[8]:
-            continue
+                    # Validate checksum: low byte of sum(bytes 1-7) must equal byte 8
+                    if (page + status + error + high + low
+                            + version + sensor) & 0xFF != checksum:
+                        continue
 
-        # Pressure calculation: p_mbar = 10^((high*256 + low)/4000 - 12.5)
-        high = frame[4]
-        low = frame[5]
-        raw = high * 256 + low
-        pressure_mbar = 10 ** (raw / 4000 - 12.5)
-        readings.append(pressure_mbar)
+                    # Pressure calculation: p_mbar = 10^((high*256 + low)/4000 - 12.5)
+                    readings.append(_PRESSURE_LUT[(high << 8) | low])
 
-    return readings, buf
+    return readings, pos
 
 
-def write_influx_pressure(pressure_mbar):
-    """Write a pressure reading to InfluxDB, throttled to ~1/sec."""
-    global _last_influx_write
+def write_influx_pressures(readings):
+    """Queue (pressure_mbar, timestamp_ms) readings for the batching writer."""
     if not _influx:
         return
 
-    now = time.monotonic()
-    if now - _last_influx_write < 1.0:
-        return
-    _last_influx_write = now
-
-    from influxdb_client import Point
-
-    point = (
-        Point(_influx["measurement"])
-        .field("pressure_mbar", pressure_mbar)
-    )
+    # Raw line protocol from the precomputed prefix: no Point per reading,
+    # and the whole burst goes to the write API as one record
+    prefix = _influx.lp_prefix
+    payload = b"\n".join([b"%s%.6e %d" % (prefix, pressure_mbar, timestamp_ms)
+                          for pressure_mbar, timestamp_ms in readings])
     try:
-        _influx["write_api"].write(
-            bucket=_influx["bucket"],
-            org=_influx["org"],
-            record=point,
+        _influx.write_api.write(
+            bucket=_influx.bucket,
+            org=_influx.org,
+            record=payload,
+            write_precision=WritePrecision.MS,
         )
     except Exception as e:
         if not _tui_active:
@@ -509,33 +601,228 @@ def write_influx_pressure(pressure_mbar):
 
 
 # ─────────────────────────────────────────────────────────────────────────────
-# TRANSPORT HANDLERS
+# READING CONSUMERS
+# The serial path only parses and publishes; terminal and InfluxDB I/O run in
+# their own tasks so a slow terminal or HTTP stall never delays ws.send.
 # ─────────────────────────────────────────────────────────────────────────────
 
-async def serial_to_ws(ser, ws):
-    """Read raw bytes from serial and send as binary WebSocket frames."""
-    loop = asyncio.get_event_loop()
-    parse_buf = b""
+def publish_readings(readings):
+    """Hand parsed readings to the TUI and InfluxDB consumers (non-blocking)."""
+    global _latest_pressure, _reading_count, _dropped_readings, _last_stamp_ms
+
+    _latest_pressure = readings[-1]
+    _reading_count += len(readings)
+    if _influx:
+        # One serial chunk can carry several frames; stamping them all with
+        # the same millisecond would make InfluxDB keep only the last one.
+        # The newest reading gets the arrival time and earlier ones are
+        # spaced back by the gauge's frame interval, never reaching back to
+        # a timestamp already used by the previous chunk.
+        now_ms = time.time_ns() // 1_000_000
+        last = len(readings) - 1
+        for i, pressure_mbar in enumerate(readings):
+            _last_stamp_ms = max(now_ms - (last - i) * FRAME_INTERVAL_MS,
+                                 _last_stamp_ms + 1)
+            try:
+                _pressure_queue.put_nowait((pressure_mbar, _last_stamp_ms))
+            except asyncio.QueueFull:
+                if not _dropped_readings and not _tui_active:
+                    print("  InfluxDB queue full — dropping readings")
+                _dropped_readings += 1
+
+
+async def tui_consumer():
+    """Redraw the pressure rows at TUI_UPDATE_HZ when a new reading exists."""
+    shown = 0
     while True:
+        await asyncio.sleep(1.0 / TUI_UPDATE_HZ)
+        if _reading_count != shown:
+            shown = _reading_count
+            tui_update_reading(_latest_pressure)
+
+
+async def influx_consumer():
+    """Feed queued readings to the batching InfluxDB write API.
+
+    Each wakeup drains everything queued so far into a single write call.
+    """
+    while True:
+        readings = [await _pressure_queue.get()]
+        while not _pressure_queue.empty():
+            readings.append(_pressure_queue.get_nowait())
+        write_influx_pressures(readings)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# TRANSPORT HANDLERS
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _read_waiting(ser):
+    """Block (up to the port timeout) for one byte, then drain the OS buffer.
+
+    A fixed ser.read(256) waits for all 256 bytes or the port timeout, so
+    latency is bounded by the first byte's arrival instead, and everything
+    already buffered comes back in the same call.
+    """
+    data = ser.read(1)
+    if data:
+        waiting = ser.in_waiting
+        if waiting:
+            data += ser.read(waiting)
+    return data
+
+
+def _serial_read_thread(ser, loop, chunks, stop):
+    """Blocking read loop for platforms without add_reader on serial ports.
+
+    Runs on its own thread and hands each chunk (or the exception that ended
+    the loop) to the event loop with call_soon_threadsafe.
+    """
+    while not stop.is_set():
         try:
-            data = await loop.run_in_executor(None, ser.read, 256)
+            data = _read_waiting(ser)
         except serial.SerialException as e:
-            if not _tui_active:
-                print(f"\n  Serial read error: {e}")
+            data = e
+        if not data:
+            continue
+        try:
+            loop.call_soon_threadsafe(chunks.put_nowait, data)
+        except RuntimeError:  # event loop already closed
+            return
+        if isinstance(data, Exception):
             return
-        if data:
+
+
+async def serial_chunks(ser):
+    """Yield raw byte chunks from serial as they arrive.
+
+    On POSIX the serial fd is watched by the event loop itself (add_reader),
+    so reads need no thread handoff. Elsewhere (Windows) one dedicated
+    thread runs the blocking reads and queues the chunks. Raises
+    serial.SerialException when the port fails or disappears.
+    """
+    loop = asyncio.get_running_loop()
+    chunks = asyncio.Queue()
+
+    if os.name == "posix":
+        fd = ser.fileno()
+
+        def on_readable():
             try:
-                await ws.send(data)
-            except websockets.ConnectionClosed:
+                data = os.read(fd, 4096)
+            except BlockingIOError:
                 return
-            # Always parse frames for TUI display and InfluxDB
-            parse_buf += data
-            readings, parse_buf = parse_itr90_frames(parse_buf)
-            for pressure in readings:
-                tui_update_reading(pressure)
-                write_influx_pressure(pressure)
-        else:
-            await asyncio.sleep(0.01)
+            except OSError as e:
+                data = e
+            if not data:
+                data = serial.SerialException("device reports readiness to read "
+                                              "but returned no data (disconnected?)")
+            if isinstance(data, Exception):
+                loop.remove_reader(fd)
+            chunks.put_nowait(data)
+
+        loop.add_reader(fd, on_readable)
+        stop_reading = lambda: loop.remove_reader(fd)  # noqa: E731
+    else:
+        stop = threading.Event()
+        threading.Thread(target=_serial_read_thread, name="serial", daemon=True,
+                         args=(ser, loop, chunks, stop)).start()
+        stop_reading = stop.set
+
+    try:
+        while True:
+            data = await chunks.get()
+            if isinstance(data, Exception):
+                raise serial.SerialException(str(data))
+            yield data
+    finally:
+        stop_reading()
+
+
+async def ws_sender(ws, chunks):
+    """Send queued serial chunks as binary WebSocket frames.
+
+    Chunks arriving within WS_COALESCE_S of the first one (up to
+    WS_COALESCE_BYTES) are joined into a single frame, so one send carries
+    several gauge frames. Returns when the connection closes or when
+    serial_reader queues None to signal that the serial port is gone.
+    """
+    loop = asyncio.get_running_loop()
+    pending = bytearray()
+    stopped = False
+    while not stopped:
+        data = await chunks.get()
+        if data is None:
+            return
+        pending += data
+        deadline = loop.time() + WS_COALESCE_S
+        while len(pending) < WS_COALESCE_BYTES:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                data = await asyncio.wait_for(chunks.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            if data is None:
+                stopped = True
+                break
+            pending += data
+        try:
+            await ws.send(bytes(pending))
+        except websockets.ConnectionClosed:
+            return
+        pending.clear()
+
+
+async def serial_reader(ser):
+    """Single serial drain: parse readings once, fan raw chunks out to clients.
+
+    Every connected client has a queue in _subscribers. A slow client only
+    backs up its own queue: at most WS_QUEUE_MAX chunks wait (the oldest is
+    dropped first, counted in _dropped_bytes). The parse buffer is capped at
+    PARSE_BUF_MAX as a guard against a single very large read, with trimmed
+    bytes counted in _parse_dropped. Returns when the serial port fails,
+    after queuing None for every client.
+    """
+    global _dropped_bytes, _parse_dropped
+
+    parse_buf = bytearray()
+    drop_logged = False
+    async with contextlib.aclosing(serial_chunks(ser)) as reader:
+        try:
+            async for data in reader:
+                for chunks in _subscribers:
+                    if chunks.full():
+                        _dropped_bytes += len(chunks.get_nowait())
+                        if not drop_logged and not _tui_active:
+                            print("  Client too slow — dropping oldest data")
+                            drop_logged = True
+                    chunks.put_nowait(data)
+                # Parse frames only if the TUI or InfluxDB will use readings,
+                # and only once a whole frame can be in the buffer
+                if not (_tui_active or _influx):
+                    continue
+                parse_buf.extend(data)
+                if len(parse_buf) > PARSE_BUF_MAX:
+                    excess = len(parse_buf) - PARSE_BUF_MAX
+                    del parse_buf[:excess]
+                    _parse_dropped += excess
+                if len(parse_buf) < FRAME_LENGTH:
+                    continue
+                readings, consumed = parse_itr90_frames(parse_buf)
+                del parse_buf[:consumed]
+                if readings:
+                    publish_readings(readings)
+        except serial.SerialException as e:
+            tui_stop()
+            print(f"\n  Serial read error: {e}")
+        finally:
+            # Wake every ws_sender so its handler can finish
+            for chunks in _subscribers:
+                if chunks.full():
+                    _dropped_bytes += len(chunks.get_nowait())
+                chunks.put_nowait(None)
 
 
 async def ws_to_serial(ser, ws):
@@ -557,12 +844,21 @@ async def handler(ws, ser):
     """Handle a single WebSocket connection."""
     peer = getattr(ws, "remote_address", None)
     tui_update_client(peer, True)
+    chunks = asyncio.Queue(maxsize=WS_QUEUE_MAX)
+    _subscribers.add(chunks)
+    # Either side ending (client gone, or serial_reader stopped) ends the
+    # connection; the other side is cancelled rather than left waiting.
+    tasks = [
+        asyncio.create_task(ws_sender(ws, chunks)),
+        asyncio.create_task(ws_to_serial(ser, ws)),
+    ]
     try:
-        await asyncio.gather(
-            serial_to_ws(ser, ws),
-            ws_to_serial(ser, ws),
-        )
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
     finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        _subscribers.discard(chunks)
         tui_update_client(peer, False)
 
 
@@ -588,21 +884,33 @@ async def main():
     print(f"Serial port opened: {ser.name}")
 
     influx_cfg = setup_influxdb()
-    influx_desc = (f"enabled ({influx_cfg['measurement']})"
+    influx_desc = (f"enabled ({influx_cfg.measurement})"
                    if influx_cfg else "disabled")
 
     print(f"Starting WebSocket server on ws://{WS_HOST}:{WS_PORT}")
     print("Web app can now connect via the Bridge button.\n")
     tui_start(f"serial: {ser.name}", influx_desc)
 
-    async with websockets.serve(lambda ws: handler(ws, ser), WS_HOST, WS_PORT):
-        await asyncio.Future()  # run forever
+    consumers = []  # keep references so the tasks are not garbage collected
+    if _tui_active:
+        consumers.append(asyncio.create_task(tui_consumer()))
+    if influx_cfg:
+        consumers.append(asyncio.create_task(influx_consumer()))
+
+    # Coalesced sends repeat the same marker/version/sensor bytes every 9
+    # bytes, so websockets' default permessage-deflate shrinks them well.
+    # A larger write buffer absorbs backlog drains without pausing the relay.
+    async with websockets.serve(lambda ws: handler(ws, ser), WS_HOST, WS_PORT,
+                                write_limit=2**20):
+        await serial_reader(ser)  # runs until the serial port fails
 
 
 if __name__ == "__main__":
+    run = uvloop.run if uvloop is not None else asyncio.run
     try:
-        asyncio.run(main())
+        run(main())
     except KeyboardInterrupt:
-        tui_stop()
-        close_influxdb()
-        print("\nBridge stopped.")
+        pass
+    tui_stop()
+    close_influxdb()
+    print("\nBridge stopped.")
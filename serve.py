@@ -16,7 +16,7 @@ import webbrowser
 
 PORT = 8001
 os.chdir(os.path.dirname(os.path.abspath(__file__)))
-server = http.server.HTTPServer(("", PORT), http.server.SimpleHTTPRequestHandler)
+server = http.server.ThreadingHTTPServer(("", PORT), http.server.SimpleHTTPRequestHandler)
 print(f"Serving at http://localhost:{PORT}")
 webbrowser.open(f"http://localhost:{PORT}")
 server.serve_forever()